@@ -1,39 +1,86 @@
-from .config import ServiceSettings
-from .infrastructure import db
-from .logging import (
-    LogExporterSettings,
-    configure_loguru_logging,
-    configure_std_logging,
-)
-from .observability import (
-    build_resource,
-    get_tracer,
-    init_observability,
-    init_otel_fastapi,
-    init_otel_worker,
-    parse_otlp_headers,
-)
-from .utils import (
-    FingerprintMixin,
-    ValidatedModel,
-    ValidatedSettings,
-    parse_cors_origins,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ServiceSettings
+    from .infrastructure import db
+    from .logging import (
+        LogExporterSettings,
+        LogSettings,
+        configure_loguru_logging,
+        configure_std_logging,
+    )
+    from .observability import (
+        build_resource,
+        get_tracer,
+        init_observability,
+        init_otel_fastapi,
+        init_otel_worker,
+        parse_otlp_headers,
+    )
+    from .utils import (
+        FingerprintMixin,
+        ValidatedModel,
+        ValidatedSettings,
+        parse_cors_origins,
+    )
+
+# Public names are resolved on first access (PEP 562) so `import nexor` does not pull in
+# SQLAlchemy, asyncpg or OpenTelemetry until the corresponding helper is actually used.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    'ServiceSettings': ('.config', 'ServiceSettings'),
+    'db': ('.infrastructure.db', None),
+    'FingerprintMixin': ('.utils', 'FingerprintMixin'),
+    'ValidatedModel': ('.utils', 'ValidatedModel'),
+    'ValidatedSettings': ('.utils', 'ValidatedSettings'),
+    'parse_cors_origins': ('.utils', 'parse_cors_origins'),
+    'LogExporterSettings': ('.logging', 'LogExporterSettings'),
+    'LogSettings': ('.logging', 'LogSettings'),
+    'configure_loguru_logging': ('.logging', 'configure_loguru_logging'),
+    'configure_std_logging': ('.logging', 'configure_std_logging'),
+    'build_resource': ('.observability', 'build_resource'),
+    'parse_otlp_headers': ('.observability', 'parse_otlp_headers'),
+    'init_observability': ('.observability', 'init_observability'),
+    'init_otel_fastapi': ('.observability', 'init_otel_fastapi'),
+    'init_otel_worker': ('.observability', 'init_otel_worker'),
+    'get_tracer': ('.observability', 'get_tracer'),
+}
+
+# Submodules that the eager imports used to bind as package attributes.
+_LAZY_SUBMODULES = frozenset({'config', 'infrastructure', 'logging', 'observability', 'utils'})
 
 __all__ = [
-    'ServiceSettings',
-    'db',
     'FingerprintMixin',
+    'LogExporterSettings',
+    'LogSettings',
+    'ServiceSettings',
     'ValidatedModel',
     'ValidatedSettings',
-    'parse_cors_origins',
-    'LogExporterSettings',
+    'build_resource',
     'configure_loguru_logging',
     'configure_std_logging',
-    'build_resource',
-    'parse_otlp_headers',
+    'db',
+    'get_tracer',
     'init_observability',
     'init_otel_fastapi',
     'init_otel_worker',
-    'get_tracer',
+    'parse_cors_origins',
+    'parse_otlp_headers',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,3 +1,3 @@
 from .settings import DatabaseSettings, NexorDBSettings, ServiceSettings
 
-__all__ = ['NexorDBSettings', 'ServiceSettings', 'DatabaseSettings']
+__all__ = ['DatabaseSettings', 'NexorDBSettings', 'ServiceSettings']
@@ -1,14 +1,38 @@
 import warnings
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings
-from sqlalchemy.engine import make_url
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import URL, make_url
 
 from nexor.utils import ValidatedSettings, get_app_version, normalize_postgres_url
 
+Environment = Literal['development', 'production', 'testing']
+
+
+@lru_cache(maxsize=64)
+def _make_url_cached(dsn: str) -> URL:
+    return make_url(dsn)
+
+
+@lru_cache(maxsize=64)
+def _swap_driver_cached(raw_url: str, drivername: str) -> SecretStr:
+    # The scheme is the only part that changes, so splice it instead of re-rendering the parsed URL.
+    return SecretStr(drivername + raw_url[raw_url.index('://') :])
+
+
+def _postgres_url_with_driver(url: SecretStr, drivername: str) -> SecretStr:
+    raw_url = url.get_secret_value()
+    if _make_url_cached(raw_url).drivername == drivername:
+        return url
+    return _swap_driver_cached(raw_url, drivername)
+
 
 class DatabaseSettings(BaseSettings):
+    # Frozen: the engines and pools are cached by the URLs derived from these settings.
+    model_config = SettingsConfigDict(frozen=True, validate_assignment=False)
+
     postgres_url: SecretStr
     alembic_url: SecretStr
     app_schema: str
@@ -16,42 +40,36 @@ class DatabaseSettings(BaseSettings):
     db_pool_size: int = 20
     db_max_overflow: int = 20
     db_pool_timeout: int = 30
+    db_health_ttl: float = 2.0
 
     @field_validator('postgres_url', mode='before')
     @classmethod
-    def _normalize_postgres_url(cls, url: str | SecretStr | None) -> SecretStr | None:
+    def _normalize_postgres_url(cls, url: str | SecretStr | None) -> str | None:
         if url is None:
             return None
-        if isinstance(url, SecretStr):
-            url = url.get_secret_value()
-        normalized_url = normalize_postgres_url(url)
-        return SecretStr(normalized_url)
+        # Return the plain string; pydantic wraps it into the annotated SecretStr.
+        return normalize_postgres_url(url.get_secret_value() if isinstance(url, SecretStr) else url)
 
     @field_validator('alembic_url', mode='before')
     @classmethod
-    def _normalize_alembic_url(cls, url: str | SecretStr | None) -> SecretStr | None:
+    def _normalize_alembic_url(cls, url: str | SecretStr | None) -> str | None:
         if url is None:
             return None
-        if isinstance(url, SecretStr):
-            url = url.get_secret_value()
-        normalized_url = normalize_postgres_url(url)
-        return SecretStr(normalized_url)
+        return normalize_postgres_url(url.get_secret_value() if isinstance(url, SecretStr) else url)
 
+    # Derived from the current source URL on every access (memoized per source URL), so a
+    # `model_copy(update=...)` never inherits the original's derivation.
     @property
     def async_postgres_url(self) -> SecretStr:
         if self.postgres_url is None:
             raise RuntimeError('postgres_url must be provided to build async_postgres_url')
-        url = make_url(self.postgres_url.get_secret_value())
-        url = url.set(drivername='postgresql+asyncpg')
-        return SecretStr(url.render_as_string(hide_password=False))
+        return _postgres_url_with_driver(self.postgres_url, 'postgresql+asyncpg')
 
     @property
     def migration_url(self) -> SecretStr:
         if self.alembic_url is None:
             raise RuntimeError('alembic_url must be provided to build migration_url')
-        url = make_url(self.alembic_url.get_secret_value())
-        url = url.set(drivername='postgresql+psycopg')
-        return SecretStr(url.render_as_string(hide_password=False))
+        return _postgres_url_with_driver(self.alembic_url, 'postgresql+psycopg')
 
     @field_validator('app_schema')
     @classmethod
@@ -77,7 +95,7 @@ class NexorDBSettings(DatabaseSettings):
 class ServiceSettings(ValidatedSettings):
     """Lightweight base settings for database-backed services."""
 
-    env: Literal['development', 'production', 'testing'] = 'production'
+    env: Environment = 'production'
     version: str = Field(default_factory=get_app_version)
     debug: bool | None = None
 
@@ -1,12 +1,34 @@
+import asyncio
+from functools import partial
 from typing import Awaitable, Callable, TypeVar
 
 from fastapi import APIRouter, FastAPI, HTTPException
+from sqlalchemy import text
 
 from nexor.config.settings import DatabaseSettings
-from nexor.infrastructure.db import test_db_connection
+from nexor.infrastructure.db import _recently_ok, _record_ok, get_engine, test_db_connection
 
 S = TypeVar('S', bound=DatabaseSettings)
 
+DB_PING_TIMEOUT_SECONDS = 1.0
+
+
+async def _ping_db(settings: DatabaseSettings, timeout: float = DB_PING_TIMEOUT_SECONDS) -> None:
+    """Run a single `SELECT 1` on the cached engine without retries or engine disposal.
+
+    A check that succeeded within `settings.db_health_ttl` (including a `/live/deep` one) is reused
+    instead of touching the database again.
+    """
+    if _recently_ok(settings):
+        return
+
+    async def _select_one() -> None:
+        async with get_engine(settings).connect() as conn:
+            await conn.execute(text('SELECT 1'))
+
+    await asyncio.wait_for(_select_one(), timeout=timeout)
+    _record_ok(settings)
+
 
 async def _noop_worker_ping() -> None:
     """Default worker ping that does nothing."""
@@ -35,12 +57,22 @@ def install_health_routes(
         return
 
     router = APIRouter(prefix=prefix, tags=['health'])
+    ping_db = partial(_ping_db, settings)
+    check_db = partial(test_db_connection, settings, force=True)
 
     @router.get('/live')
     async def live():  # pragma: no cover - lightweight healthcheck
         try:
-            await test_db_connection(settings)
+            await ping_db()
         except Exception as exc:
+            raise HTTPException(status_code=503, detail=str(exc) or 'Database ping failed')
+        return {'status': 'ok'}
+
+    @router.get('/live/deep')
+    async def live_deep():  # pragma: no cover - full connection test
+        try:
+            await check_db()
+        except RuntimeError as exc:  # test_db_connection wraps every failure in RuntimeError
             raise HTTPException(status_code=503, detail=str(exc))
         return {'status': 'ok'}
 
@@ -1,15 +1,16 @@
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+import re
+import weakref
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from functools import wraps
-from typing import Tuple
+from functools import lru_cache, partial
+from time import monotonic
 from uuid import UUID
 
 import asyncpg
 from pydantic import SecretStr
-from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 from tenauth import AccessContext, access_scoped_session_ctx
 
@@ -18,12 +19,25 @@ from nexor.config.settings import DatabaseSettings
 logger = logging.getLogger(__name__)
 
 Loop = asyncio.AbstractEventLoop
-SessionFactory = async_sessionmaker[AsyncSession]
+SessionFactory = Callable[[], AsyncSession]
 
-_engine_cache: dict[Tuple[Loop, str], AsyncEngine] = {}
-_sessionmaker_cache: dict[Tuple[Loop, str], SessionFactory] = {}
+# Caches are keyed by ``id(loop)`` and then by DSN. Connected engines and pools reference their loop, so a loop's
+# entries are only released by `dispose_engines(loop=...)`; the finalizer merely cleans up after a loop that is
+# collected once nothing cached keeps it alive (e.g. engines that never connected, or after disposal).
+_engine_cache: dict[int, dict[str, AsyncEngine]] = {}
+_sessionmaker_cache: dict[int, dict[str, SessionFactory]] = {}
+_asyncpg_pool_cache: dict[int, dict[str, asyncpg.Pool]] = {}
+_tracked_loops: set[int] = set()
+_last_ok: dict[int, dict[str, float]] = {}
 
 DB_CONNECTION_TEST_RETRIES = 3
+PG_POOL_MIN_SIZE = 1
+PG_POOL_MAX_SIZE = 10
+PG_POOL_CLOSE_TIMEOUT_SECONDS = 10.0
+
+_DRIVER_RE = re.compile(r'^postgres(?:ql)?(?:\+[a-z0-9_]+)?://')
+# Session-level so it survives the checkout; the pool's `RESET ALL` on release clears it again.
+_SET_TENANT_SQL = "SELECT set_config('app.tenant_id', $1, false)"
 
 
 def _current_loop() -> Loop:
@@ -33,8 +47,23 @@ def _current_loop() -> Loop:
         raise RuntimeError('A running event loop is required to access the async engine') from exc
 
 
-def _cache_key(loop: Loop, url: str) -> Tuple[Loop, str]:
-    return loop, url
+def _forget_loop(loop_id: int) -> None:
+    _tracked_loops.discard(loop_id)
+    _engine_cache.pop(loop_id, None)
+    _sessionmaker_cache.pop(loop_id, None)
+    _asyncpg_pool_cache.pop(loop_id, None)
+    _last_ok.pop(loop_id, None)
+
+
+def _track_loop(loop: Loop) -> None:
+    loop_id = id(loop)
+    if loop_id in _tracked_loops:
+        return
+    try:
+        weakref.finalize(loop, _forget_loop, loop_id)
+    except TypeError:  # pragma: no cover - loop implementation without weakref support
+        return
+    _tracked_loops.add(loop_id)
 
 
 def _normalize_async_url(settings: DatabaseSettings) -> str:
@@ -59,34 +88,40 @@ def get_engine(settings: DatabaseSettings) -> AsyncEngine:
     """
     loop = _current_loop()
     url = _normalize_async_url(settings)
-    key = _cache_key(loop, url)
-    engine = _engine_cache.get(key)
+    engines = _engine_cache.get(id(loop))
+    engine = engines.get(url) if engines is not None else None
     if engine is None:
+        pool_size = settings.db_pool_size
+        max_overflow = settings.db_max_overflow
+        pool_timeout = settings.db_pool_timeout
+        echo = bool(settings.debug)
+        if echo and getattr(settings, 'env', None) == 'production':
+            # Statement echo logs every query synchronously; never let a stray DEBUG flag enable it in production.
+            logger.warning('Ignoring debug=True for SQL echo because env is production')
+            echo = False
         engine = create_async_engine(
             url,
-            echo=settings.debug,
+            echo=echo,
             pool_pre_ping=True,
             pool_recycle=3600,
-            pool_size=settings.db_pool_size,
-            max_overflow=settings.db_max_overflow,
-            pool_timeout=settings.db_pool_timeout,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
         )
-        _engine_cache[key] = engine
+        _track_loop(loop)
+        _engine_cache.setdefault(id(loop), {})[url] = engine
     return engine
 
 
 def _get_sessionmaker(settings: DatabaseSettings) -> SessionFactory:
     loop = _current_loop()
     url = _normalize_async_url(settings)
-    key = _cache_key(loop, url)
-    sessionmaker = _sessionmaker_cache.get(key)
+    sessionmakers = _sessionmaker_cache.get(id(loop))
+    sessionmaker = sessionmakers.get(url) if sessionmakers is not None else None
     if sessionmaker is None:
-        sessionmaker = async_sessionmaker(
-            bind=get_engine(settings),
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-        _sessionmaker_cache[key] = sessionmaker
+        # A bound constructor is all `session_factory` needs; it skips async_sessionmaker's call indirection.
+        sessionmaker = partial(AsyncSession, bind=get_engine(settings), expire_on_commit=False)
+        _sessionmaker_cache.setdefault(id(loop), {})[url] = sessionmaker
     return sessionmaker
 
 
@@ -145,7 +180,7 @@ async def scoped_session(
         database.
     """
     async with access_scoped_session_ctx(
-        session_factory=lambda: session_factory(settings),
+        session_factory=partial(session_factory, settings),
         access_context=access_context,
         verify=verify,
     ) as session:
@@ -160,42 +195,106 @@ async def scoped_session(
                 await session.commit()
 
 
+def _to_asyncpg_dsn(dsn: str) -> str:
+    """Strip any SQLAlchemy ``+driver`` suffix and normalise the scheme to ``postgresql://``."""
+    return _DRIVER_RE.sub('postgresql://', dsn, count=1)
+
+
+@lru_cache(maxsize=1024)
+def _server_settings_for(tenant_id: UUID) -> dict[str, str]:
+    # asyncpg requires a real dict here and only ever reads it, so the cached instance is shared.
+    return {'app.tenant_id': str(tenant_id)}
+
+
 async def pg_connect(postgres_url: SecretStr, tenant_id: UUID | None) -> asyncpg.Connection:
-    url = make_url(postgres_url.get_secret_value())
-    if '+' in url.drivername:
-        drivername = url.drivername.split('+', 1)[0]
-        url = url.set(drivername=drivername)
-    dsn = url.render_as_string(hide_password=False)
+    dsn = _to_asyncpg_dsn(postgres_url.get_secret_value())
     if tenant_id is None:
         return await asyncpg.connect(dsn=dsn)
-    return await asyncpg.connect(dsn=dsn, server_settings={'app.tenant_id': str(tenant_id)})
+    return await asyncpg.connect(dsn=dsn, server_settings=_server_settings_for(tenant_id))
+
+
+async def get_asyncpg_pool(postgres_url: SecretStr) -> asyncpg.Pool:
+    """
+    Creates or retrieves a cached asyncpg connection pool for the running event loop.
+
+    Pools are cached per event loop and DSN, mirroring `get_engine`, and are closed
+    by `dispose_engines`.
+
+    Args:
+        postgres_url (SecretStr): The PostgreSQL DSN; any SQLAlchemy driver suffix is
+            stripped before connecting.
+
+    Returns:
+        asyncpg.Pool: An initialised connection pool bound to the running event loop.
+    """
+    loop = _current_loop()
+    dsn = _to_asyncpg_dsn(postgres_url.get_secret_value())
+    pools = _asyncpg_pool_cache.get(id(loop))
+    pool = pools.get(dsn) if pools is not None else None
+    if pool is None:
+        created = await asyncpg.create_pool(dsn=dsn, min_size=PG_POOL_MIN_SIZE, max_size=PG_POOL_MAX_SIZE)
+        _track_loop(loop)
+        pool = _asyncpg_pool_cache.setdefault(id(loop), {}).setdefault(dsn, created)
+        if pool is not created:
+            # Another task won the race while the pool was connecting.
+            await created.close()
+    return pool
 
 
 @asynccontextmanager
 async def pg_connection(
-    postgres_url: SecretStr,
+    postgres_url: SecretStr | asyncpg.Pool,
     tenant_id: UUID | None,
 ) -> AsyncIterator[asyncpg.Connection]:
-    conn = await pg_connect(postgres_url, tenant_id)
-    try:
+    """
+    Checks out a pooled asyncpg connection, optionally bound to a tenant.
+
+    Args:
+        postgres_url (SecretStr | asyncpg.Pool): The PostgreSQL DSN used to look up
+            the cached pool, or a caller-managed pool to check out from directly.
+        tenant_id (UUID | None): When given, `app.tenant_id` is set for the
+            duration of the checkout.
+
+    Yields:
+        asyncpg.Connection: A connection that is returned to the pool on exit.
+    """
+    pool = await get_asyncpg_pool(postgres_url) if isinstance(postgres_url, SecretStr) else postgres_url
+    async with pool.acquire() as conn:
+        if tenant_id is not None:
+            await conn.execute(_SET_TENANT_SQL, str(tenant_id))
         yield conn
-    finally:
-        await conn.close()
 
 
-async def dispose_engines(*, loop: Loop | None = None) -> None:
+async def _close_pool(pool: asyncpg.Pool) -> None:
+    # close() waits for every checked-out connection to be released; don't let one long-running user stall disposal.
+    try:
+        await asyncio.wait_for(pool.close(), timeout=PG_POOL_CLOSE_TIMEOUT_SECONDS)
+    except TimeoutError:
+        logger.warning('Timed out closing asyncpg pool; terminating its connections')
+        pool.terminate()
+
+
+async def dispose_engines(*, loop: Loop | None = None, include_pools: bool = True) -> None:
     """
     Dispose all database engines associated with a specific event loop.
 
-    This asynchronous function disposes of all database engine instances that
-    are tied to a particular event loop, freeing up resources. If no event loop
+    This asynchronous function disposes of all database engine instances and
+    closes all asyncpg pools that are tied to a particular event loop, freeing
+    up resources. If no event loop
     is provided, it attempts to retrieve the current default event loop. If
     the retrieval of the event loop fails, the function exits gracefully.
 
+    Call this before closing an event loop that used the database: cached engines
+    and pools with open connections keep their loop alive, so its entries are not
+    evicted automatically.
+
     Args:
         loop (Loop | None): The specific event loop for which to dispose
             associated engines. If None, the current event loop is retrieved
             and used.
+        include_pools (bool): Also close the loop's asyncpg pools. A pool that
+            does not close within `PG_POOL_CLOSE_TIMEOUT_SECONDS` is terminated.
+            Defaults to True.
 
     Returns:
         None
@@ -206,66 +305,72 @@ async def dispose_engines(*, loop: Loop | None = None) -> None:
         except RuntimeError:
             return
 
-    to_dispose = [key for key in _engine_cache if key[0] is loop]
-    for key in to_dispose:
-        engine = _engine_cache.pop(key, None)
-        _sessionmaker_cache.pop(key, None)
-        if engine is not None:
-            await engine.dispose()
-
+    _sessionmaker_cache.pop(id(loop), None)
+    engines = _engine_cache.pop(id(loop), {})
+    for engine in engines.values():
+        await engine.dispose()
+    if not include_pools:
+        return
+    pools = _asyncpg_pool_cache.pop(id(loop), {})
+    for pool in pools.values():
+        await _close_pool(pool)
 
-def _retry_connection_after_dispose(max_attempts: int):
-    if max_attempts < 1:
-        raise ValueError('max_attempts must be at least 1')
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exc: Exception | None = None
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as exc:
-                    last_exc = exc
-                    if attempt >= max_attempts:
-                        raise
-                    await dispose_engines()
-            assert last_exc is not None
-            return None
+def _recently_ok(settings: DatabaseSettings) -> bool:
+    """Whether a database check for these settings succeeded on this loop within `settings.db_health_ttl`."""
+    last_ok = _last_ok.get(id(_current_loop()))
+    if last_ok is None:
+        return False
+    return monotonic() - last_ok.get(_normalize_async_url(settings), float('-inf')) < settings.db_health_ttl
 
-        return wrapper
 
-    return decorator
+def _record_ok(settings: DatabaseSettings) -> None:
+    _last_ok.setdefault(id(_current_loop()), {})[_normalize_async_url(settings)] = monotonic()
 
 
-@_retry_connection_after_dispose(DB_CONNECTION_TEST_RETRIES)
-async def _test_db_connection_once(settings: DatabaseSettings) -> None:
+async def _test_db_connection_once(settings: DatabaseSettings, force: bool = False) -> None:
+    if not force and _recently_ok(settings):
+        return
+    _last_ok.get(id(_current_loop()), {}).pop(_normalize_async_url(settings), None)
     engine = get_engine(settings)
-    logger.info(engine.url.render_as_string(hide_password=False))
+    # Lazy %-formatting: the URL is only rendered (with the password masked) if the record is emitted.
+    logger.info('Testing database connection to %s', engine.url)
     async with engine.connect():
         pass
+    _record_ok(settings)
 
 
-async def test_db_connection(settings: DatabaseSettings) -> None:
+async def test_db_connection(settings: DatabaseSettings, *, force: bool = False) -> None:
     """
     Tests the database connection using the provided settings.
 
     This function attempts to establish a database connection and logs the result.
     If the connection fails, it disposes of the database engines and raises a
     RuntimeError. It's intended to ensure the database service settings are
-    correct and functional.
+    correct and functional. A successful check is remembered for
+    `settings.db_health_ttl` seconds, during which further calls return without
+    touching the database.
 
     Args:
         settings: The database configuration required for establishing the database
             connection.
+        force: Bypass the remembered result and always connect.
 
     Raises:
         RuntimeError: If the database connection could not be established.
     """
     try:
-        await _test_db_connection_once(settings)
+        for attempt in range(1, DB_CONNECTION_TEST_RETRIES + 1):
+            try:
+                await _test_db_connection_once(settings, force)
+                break
+            except Exception:
+                if attempt >= DB_CONNECTION_TEST_RETRIES:
+                    raise
+                await dispose_engines(include_pools=False)
         logger.info('Database connection test successful')
     except Exception as exc:
         logger.exception('Database connection test failed')
-        await dispose_engines()
+        # The check only exercises the SQLAlchemy engine; the separate asyncpg pools stay up.
+        await dispose_engines(include_pools=False)
         raise RuntimeError('Failed to connect to database') from exc
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import os
+import queue
 import sys
+import weakref
 from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from typing import TYPE_CHECKING, Mapping
 
 from loguru import logger
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
 
 from nexor.observability import build_resource, parse_otlp_headers
 
@@ -15,19 +23,185 @@ if TYPE_CHECKING:
 _configured_loguru = False
 _loguru_forward_added = False
 _configured_stdlib = False
+_queue_listener: QueueListener | None = None
+_queue_handler: _DroppingQueueHandler | None = None
+# Handlers that must run on the logging thread itself (see `_add_root_handler`) and stay out of the queue.
+_direct_handlers: weakref.WeakSet[logging.Handler] = weakref.WeakSet()
+
+DEFAULT_LOG_QUEUE_MAXSIZE = 10_000
+_SENTINEL_PUT_TIMEOUT_SECONDS = 1.0
+_STDLIB_CONSOLE_FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s - %(message)s'
+
+
+_LOGURU_TO_STDLIB: Mapping[str, int] = {
+    'TRACE': logging.DEBUG,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'SUCCESS': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
 
 
 def _map_loguru_level(level_name: str) -> int:
-    mapping = {
-        'TRACE': logging.DEBUG,
-        'DEBUG': logging.DEBUG,
-        'INFO': logging.INFO,
-        'SUCCESS': logging.INFO,
-        'WARNING': logging.WARNING,
-        'ERROR': logging.ERROR,
-        'CRITICAL': logging.CRITICAL,
-    }
-    return mapping.get(level_name.upper(), logging.INFO)
+    return _LOGURU_TO_STDLIB.get(level_name.upper(), logging.INFO)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that evicts the oldest queued record instead of blocking when the bounded queue is full."""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener lives in this process, so keep exc_info for the real handlers (the default
+        # implementation strips it for pickling); only merge the arguments in case they are mutated later.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Handler.handle() holds self.lock around emit(), so the counter needs no extra locking.
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.queue.task_done()
+            self.dropped += 1
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BoundedQueueListener(QueueListener):
+    """QueueListener whose shutdown cannot fail because the bounded queue is full."""
+
+    def enqueue_sentinel(self) -> None:
+        # The default put_nowait raises queue.Full at shutdown; the listener is still draining, so
+        # wait briefly for a free slot before falling back to evicting the oldest record.
+        try:
+            self.queue.put(self._sentinel, timeout=_SENTINEL_PUT_TIMEOUT_SECONDS)
+            return
+        except queue.Full:
+            pass
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                continue
+
+
+def _register_dropped_records_metric(handler: _DroppingQueueHandler) -> None:
+    def observe(options: CallbackOptions) -> list[Observation]:
+        return [Observation(handler.dropped)]
+
+    metrics.get_meter('nexor.logging').create_observable_counter(
+        'nexor.logging.dropped_records',
+        callbacks=[observe],
+        unit='{record}',
+        description='Log records evicted from the bounded logging queue.',
+    )
+
+
+def _install_queue_pipeline(root_logger: logging.Logger, *, maxsize: int) -> None:
+    """Move the current root handlers behind a bounded queue drained by a single listener thread."""
+    global _queue_listener, _queue_handler
+    if _queue_listener is not None:
+        return
+
+    handlers = tuple(handler for handler in root_logger.handlers if handler not in _direct_handlers)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=maxsize)
+    listener = _BoundedQueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+    _register_dropped_records_metric(queue_handler)
+    listener.start()
+    atexit.register(_stop_queue_listener)
+    _queue_listener = listener
+    _queue_handler = queue_handler
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the queue listener; a no-op if it was never started or is already stopped."""
+    listener = _queue_listener
+    if listener is not None and listener._thread is not None:
+        listener.stop()
+
+
+def _restart_queue_pipeline_in_child() -> None:
+    """Give a forked child its own queue and listener thread; the parent's thread does not survive fork()."""
+    global _queue_listener
+    listener, queue_handler = _queue_listener, _queue_handler
+    if listener is None or queue_handler is None or listener._thread is None:
+        return
+    # The inherited queue may hold the parent's records (the parent emits those) or a lock taken
+    # mid-operation by the listener thread, so the child starts from a fresh one.
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=listener.queue.maxsize)
+    child_listener = _BoundedQueueListener(log_queue, *listener.handlers, respect_handler_level=True)
+    queue_handler.queue = log_queue
+    _queue_listener = child_listener
+    child_listener.start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_queue_pipeline_in_child)
+
+
+def _root_handlers(root_logger: logging.Logger) -> tuple[logging.Handler, ...]:
+    if _queue_listener is not None:
+        return (*_queue_listener.handlers, *root_logger.handlers)
+    return tuple(root_logger.handlers)
+
+
+def _add_root_handler(root_logger: logging.Logger, handler: logging.Handler, *, direct: bool = False) -> None:
+    if direct:
+        # The OTel LoggingHandler reads the active span context, which only exists on the calling thread;
+        # its batch processor already exports off-thread, so it never goes behind the queue.
+        _direct_handlers.add(handler)
+        root_logger.addHandler(handler)
+        return
+    if _queue_listener is not None:
+        # Rebinding the tuple is atomic, so the listener thread never sees a partially updated sequence.
+        _queue_listener.handlers = (*_queue_listener.handlers, handler)
+    else:
+        root_logger.addHandler(handler)
+
+
+@dataclass(frozen=True, slots=True)
+class LogSettings:
+    """
+    Typed, slotted settings object accepted by the logging helpers.
+
+    Any object exposing the same attribute names works; this class only documents the
+    supported options and their defaults.
+    """
+
+    log_level: str = 'INFO'
+    log_enqueue: bool = True
+    log_backtrace: bool = False
+    log_diagnose: bool = False
+    log_console_plain: bool = True
+    log_remove_default_sink: bool = True
+    log_console_only: bool = True
+    log_queue_maxsize: int = DEFAULT_LOG_QUEUE_MAXSIZE
+    app_name: str = 'service'
 
 
 @dataclass(frozen=True)
@@ -40,6 +214,19 @@ class LogExporterSettings:
     deployment_environment: str | None = None
     resource_extra: Mapping[str, str] | None = None
     resource: 'Resource' | None = None
+    max_queue_size: int = 8192
+    max_export_batch_size: int = 1024
+    schedule_delay_millis: int = 2000
+    export_timeout_millis: int = 30000
+
+
+def _batch_processor_options(exporter_settings: LogExporterSettings) -> dict[str, int]:
+    return {
+        'max_queue_size': exporter_settings.max_queue_size,
+        'max_export_batch_size': exporter_settings.max_export_batch_size,
+        'schedule_delay_millis': exporter_settings.schedule_delay_millis,
+        'export_timeout_millis': exporter_settings.export_timeout_millis,
+    }
 
 
 def _bridge_loguru_to_stdlib(level_name: str) -> None:
@@ -47,40 +234,34 @@ def _bridge_loguru_to_stdlib(level_name: str) -> None:
     if _loguru_forward_added:
         return
 
-    level_map: Mapping[str, int] = {
-        'TRACE': logging.DEBUG,
-        'DEBUG': logging.DEBUG,
-        'INFO': logging.INFO,
-        'SUCCESS': logging.INFO,
-        'WARNING': logging.WARNING,
-        'ERROR': logging.ERROR,
-        'CRITICAL': logging.CRITICAL,
-    }
-
-    def _forward_to_stdlog(message):
+    # Defaults bind the lookups as fast locals; this runs once per forwarded record.
+    def _forward_to_stdlog(message, _levels=_LOGURU_TO_STDLIB, _get_logger=logging.getLogger, _info=logging.INFO):
         record = message.record
-        lvl = level_map.get(record['level'].name, logging.INFO)
-        extra = record.get('extra', {})
-        logging.getLogger(record['name']).log(lvl, record['message'], extra=extra)
+        lvl = _levels.get(record['level'].name, _info)
+        # record['exception'] is loguru's (type, value, traceback) tuple, or None without an exception.
+        _get_logger(record['name']).log(lvl, record['message'], exc_info=record['exception'], extra=record['extra'])
 
+    # No loguru enqueue: the stdlib side hands records to the bounded queue pipeline.
     logger.add(
         _forward_to_stdlog,
         level=level_name,
-        enqueue=True,
+        enqueue=False,
         backtrace=False,
         diagnose=False,
     )
     _loguru_forward_added = True
 
 
-def _configure_otlp_loguru(settings: object, *, exporter_settings: LogExporterSettings) -> None:
+def _configure_otlp_loguru(
+    settings: object, *, exporter_settings: LogExporterSettings, console_via_stdlib: bool = False
+) -> bool:
     try:
         from opentelemetry._logs import set_logger_provider
         from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
         from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
         from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
     except Exception:  # pragma: no cover - optional dependency
-        return
+        return False
 
     resource = (
         exporter_settings.resource
@@ -102,17 +283,25 @@ def _configure_otlp_loguru(settings: object, *, exporter_settings: LogExporterSe
         if exporter_settings.endpoint or exporter_settings.headers
         else OTLPLogExporter()
     )
-    processor = BatchLogRecordProcessor(exporter)
+    processor = BatchLogRecordProcessor(exporter, **_batch_processor_options(exporter_settings))
     provider.add_log_record_processor(processor)
     set_logger_provider(provider)
 
     std_logging_handler = LoggingHandler(level=logging.NOTSET)
     root_logger = logging.getLogger()
-    if not any(isinstance(handler, type(std_logging_handler)) for handler in root_logger.handlers):
-        root_logger.addHandler(std_logging_handler)
+    if not any(isinstance(handler, type(std_logging_handler)) for handler in _root_handlers(root_logger)):
+        _add_root_handler(root_logger, std_logging_handler, direct=True)
+    if console_via_stdlib and not any(
+        type(handler) is logging.StreamHandler for handler in _root_handlers(root_logger)
+    ):
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter(_STDLIB_CONSOLE_FORMAT))
+        _add_root_handler(root_logger, console_handler)
     root_logger.setLevel(_map_loguru_level(getattr(settings, 'log_level', 'INFO')))
+    _install_queue_pipeline(root_logger, maxsize=getattr(settings, 'log_queue_maxsize', DEFAULT_LOG_QUEUE_MAXSIZE))
 
     _bridge_loguru_to_stdlib(getattr(settings, 'log_level', 'INFO'))
+    return True
 
 
 def configure_loguru_logging(
@@ -128,6 +317,14 @@ def configure_loguru_logging(
     is enabled, additional configuration is applied to support OTLP logging. The function
     ensures that the Loguru logger is only configured once during the runtime.
 
+    With OTLP enabled and `log_console_only=False` on the settings, Loguru keeps a single
+    sink that forwards to the standard library, and console output comes from a stdlib
+    `StreamHandler` behind the same queue, so each record is formatted only once.
+
+    `log_backtrace` and `log_diagnose` default to False: both make Loguru walk and
+    render the full traceback (including local variables for `diagnose`) on every
+    logged exception, which is far more expensive than the log call itself.
+
     Args:
         settings (object): An object containing various log configuration options such as
             log level, whether to use default sinks, and serialization preferences.
@@ -139,25 +336,33 @@ def configure_loguru_logging(
     if _configured_loguru:
         return
 
-    if getattr(settings, 'log_remove_default_sink', True):
+    otlp_enabled = bool(exporter_settings and exporter_settings.enabled)
+    console_via_stdlib = otlp_enabled and not getattr(settings, 'log_console_only', True)
+    if console_via_stdlib or getattr(settings, 'log_remove_default_sink', True):
         logger.remove()
 
-    logger.add(
-        sys.stderr,
-        level=getattr(settings, 'log_level', 'INFO'),
-        enqueue=getattr(settings, 'log_enqueue', True),
-        backtrace=getattr(settings, 'log_backtrace', True),
-        diagnose=getattr(settings, 'log_diagnose', False),
-        serialize=not getattr(settings, 'log_console_plain', True),
-        format='<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | '
-        '<level>{level: <8}</level> | '
-        '<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - '
-        '<level>{message}</level>',
-    )
-
     if exporter_settings and exporter_settings.enabled:
-        _configure_otlp_loguru(settings=settings, exporter_settings=exporter_settings)
-
+        configured = _configure_otlp_loguru(
+            settings=settings,
+            exporter_settings=exporter_settings,
+            console_via_stdlib=console_via_stdlib,
+        )
+        # Fall back to the Loguru console sink if the OTLP SDK is missing, so logs are never silenced.
+        console_via_stdlib = console_via_stdlib and configured
+
+    if not console_via_stdlib:
+        logger.add(
+            sys.stderr,
+            level=getattr(settings, 'log_level', 'INFO'),
+            enqueue=getattr(settings, 'log_enqueue', True),
+            backtrace=getattr(settings, 'log_backtrace', False),
+            diagnose=getattr(settings, 'log_diagnose', False),
+            serialize=not getattr(settings, 'log_console_plain', True),
+            format='<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | '
+            '<level>{level: <8}</level> | '
+            '<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - '
+            '<level>{message}</level>',
+        )
     _configured_loguru = True
 
 
@@ -196,11 +401,11 @@ def _configure_otlp_stdlib(
         else OTLPLogExporter()
     )
     provider = LoggerProvider(resource=resource)
-    provider.add_log_record_processor(BatchLogRecordProcessor(exporter))
+    provider.add_log_record_processor(BatchLogRecordProcessor(exporter, **_batch_processor_options(exporter_settings)))
 
     otel_handler = LoggingHandler(level=level, logger_provider=provider)
     otel_handler.setLevel(level)
-    root_logger.addHandler(otel_handler)
+    _add_root_handler(root_logger, otel_handler, direct=True)
 
 
 def configure_std_logging(
@@ -251,4 +456,5 @@ def configure_std_logging(
             settings=settings,
         )
 
+    _install_queue_pipeline(root_logger, maxsize=getattr(settings, 'log_queue_maxsize', DEFAULT_LOG_QUEUE_MAXSIZE))
     _configured_stdlib = True
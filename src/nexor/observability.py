@@ -2,26 +2,65 @@ from __future__ import annotations
 
 import os
 import socket
-from typing import Dict, Mapping, Optional
+import sys
+import threading
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-
-try:  # pragma: no cover - optional instrumentation dependency
-    from opentelemetry.instrumentation.fastapi import (  # type: ignore[missing-import]
-        FastAPIInstrumentor,
-    )
-except Exception:
-    FastAPIInstrumentor = None  # type: ignore
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+
+# The SDK, exporters and instrumentation are imported on first use so that importing this module (and
+# nexor.logging, which depends on it) only costs the lightweight API packages.
+_UNRESOLVED: Any = object()
+FastAPIInstrumentor: Any = _UNRESOLVED
+_INSTRUMENTED_APPS: weakref.WeakSet[Any] = weakref.WeakSet()
 
 _PROVIDER_INITIALISED = False
 _METRICS_INITIALISED = False
+_tracer_provider: TracerProvider | None = None
+_meter_provider: MeterProvider | None = None
+# Serialises first-time provider setup so concurrent initialisation cannot start duplicate export threads.
+_init_lock = threading.Lock()
+
+# Larger batches amortise the HTTP/serialisation cost of each OTLP export under bursty load.
+SPAN_MAX_QUEUE_SIZE = 8192
+SPAN_MAX_EXPORT_BATCH_SIZE = 1024
+SPAN_SCHEDULE_DELAY_MILLIS = 2000
+SPAN_EXPORT_TIMEOUT_MILLIS = 30000
+
+
+# Resolved once: gethostname() can hit NSS/DNS and never changes for the process lifetime.
+_HOSTNAME = socket.gethostname()
+
+
+@lru_cache(maxsize=16)
+def _create_resource(
+    service_name: str,
+    service_namespace: str,
+    deployment_environment: str,
+    service_instance_id: str,
+    extra_items: tuple[tuple[str, Any], ...],
+) -> Resource:
+    from opentelemetry.sdk.resources import Resource
+
+    base: dict[str, str] = {
+        'service.name': service_name,
+        'service.namespace': service_namespace,
+        'deployment.environment': deployment_environment,
+        'service.instance.id': service_instance_id,
+    }
+    return Resource.create(base | dict(extra_items) if extra_items else base)
+
+
+def _intern(value: str) -> str:
+    # sys.intern() rejects str subclasses (e.g. StrEnum members); those are passed through unchanged.
+    return sys.intern(value) if type(value) is str else value
 
 
 def _build_resource(
@@ -31,15 +70,22 @@ def _build_resource(
     deployment_environment: Optional[str] = None,
     extra: Optional[Mapping[str, str]] = None,
 ) -> Resource:
-    attrs: Dict[str, str] = {
-        'service.name': service_name,
-        'service.namespace': service_namespace or os.getenv('SERVICE_NAMESPACE', 'finrag'),
-        'deployment.environment': deployment_environment or os.getenv('DEPLOYMENT_ENV', 'development'),
-        'service.instance.id': os.getenv('SERVICE_INSTANCE_ID', f'{socket.gethostname()}:{os.getpid()}'),
-    }
-    if extra:
-        attrs.update(extra)
-    return Resource.create(attrs)
+    # Environment defaults are resolved before the cache lookup so that they stay part of the key; the pid is read
+    # per call because a forked worker must not inherit its parent's instance id.
+    # Interned so the cache key compares by identity and every resource shares the same string objects.
+    args = (
+        _intern(service_name),
+        _intern(service_namespace or os.getenv('SERVICE_NAMESPACE', 'finrag')),
+        _intern(deployment_environment or os.getenv('DEPLOYMENT_ENV', 'development')),
+        _intern(os.getenv('SERVICE_INSTANCE_ID', f'{_HOSTNAME}:{os.getpid()}')),
+        tuple(extra.items()) if extra else (),
+    )
+    try:
+        hash(args)
+    except TypeError:
+        # Sequence attribute values (e.g. lists) are valid but unhashable; build those resources uncached.
+        return _create_resource.__wrapped__(*args)
+    return _create_resource(*args)
 
 
 def build_resource(
@@ -52,7 +98,8 @@ def build_resource(
     """
     Builds a resource object by utilizing provided service details and additional
     metadata. This function is a wrapper around `_build_resource` to streamline
-    the creation of the resource object.
+    the creation of the resource object. Identical inputs return the same
+    cached, immutable resource instance.
 
     Args:
         service_name (str): The name of the service for which the resource is
@@ -75,14 +122,15 @@ def build_resource(
     )
 
 
-def parse_otlp_headers(raw_headers: str | None) -> Dict[str, str]:
+def parse_otlp_headers(raw_headers: str | None) -> dict[str, str]:
     """
     Parses a string of headers into a dictionary format.
 
     This function takes a string of comma-separated key-value pairs representing
     headers and parses them into a dictionary. Each key-value pair should be
     separated by an equals sign (`=`). If the input is `None` or improperly
-    formatted, an empty dictionary is returned.
+    formatted, an empty dictionary is returned. Pairs without an equals sign or
+    with an empty key are skipped.
 
     Args:
         raw_headers: A string of comma-separated key-value pairs representing
@@ -96,35 +144,73 @@ def parse_otlp_headers(raw_headers: str | None) -> Dict[str, str]:
     """
     if not raw_headers:
         return {}
-    headers: Dict[str, str] = {}
+    headers: dict[str, str] = {}
     for pair in raw_headers.split(','):
-        item = pair.strip()
-        if not item or '=' not in item:
+        key, sep, value = pair.partition('=')
+        if not sep:
             continue
-        key, value = item.split('=', 1)
-        headers[key.strip()] = value.strip()
+        key = key.strip()
+        if key:
+            headers[key] = value.strip()
     return headers
 
 
+def _fastapi_instrumentor() -> Any:
+    global FastAPIInstrumentor
+    if FastAPIInstrumentor is _UNRESOLVED:
+        try:  # pragma: no cover - optional instrumentation dependency
+            from opentelemetry.instrumentation.fastapi import (  # type: ignore[missing-import]
+                FastAPIInstrumentor as instrumentor,
+            )
+        except Exception:
+            instrumentor = None
+        FastAPIInstrumentor = instrumentor
+    return FastAPIInstrumentor
+
+
 def _ensure_provider(resource: Resource) -> TracerProvider:
-    global _PROVIDER_INITIALISED
-    provider = trace.get_tracer_provider()
-    if not isinstance(provider, TracerProvider) or not _PROVIDER_INITIALISED:
+    global _PROVIDER_INITIALISED, _tracer_provider
+    if _PROVIDER_INITIALISED and _tracer_provider is not None:
+        return _tracer_provider
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    with _init_lock:
+        if _PROVIDER_INITIALISED and _tracer_provider is not None:
+            return _tracer_provider
         provider = TracerProvider(resource=resource)
-        processor = BatchSpanProcessor(OTLPSpanExporter())
+        processor = BatchSpanProcessor(
+            OTLPSpanExporter(),
+            max_queue_size=SPAN_MAX_QUEUE_SIZE,
+            max_export_batch_size=SPAN_MAX_EXPORT_BATCH_SIZE,
+            schedule_delay_millis=SPAN_SCHEDULE_DELAY_MILLIS,
+            export_timeout_millis=SPAN_EXPORT_TIMEOUT_MILLIS,
+        )
         provider.add_span_processor(processor)
         trace.set_tracer_provider(provider)
+        _tracer_provider = provider
         _PROVIDER_INITIALISED = True
     return provider
 
 
 def _ensure_metrics_provider(resource: Resource) -> MeterProvider:
-    global _METRICS_INITIALISED
-    provider = metrics.get_meter_provider()
-    if not isinstance(provider, MeterProvider) or not _METRICS_INITIALISED:
+    global _METRICS_INITIALISED, _meter_provider
+    if _METRICS_INITIALISED and _meter_provider is not None:
+        return _meter_provider
+
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+    with _init_lock:
+        if _METRICS_INITIALISED and _meter_provider is not None:
+            return _meter_provider
         reader = PeriodicExportingMetricReader(OTLPMetricExporter())
         provider = MeterProvider(resource=resource, metric_readers=[reader])
         metrics.set_meter_provider(provider)
+        _meter_provider = provider
         _METRICS_INITIALISED = True
     return provider
 
@@ -169,6 +255,7 @@ def init_otel_fastapi(
     service_namespace: Optional[str] = None,
     deployment_environment: Optional[str] = None,
     extra: Optional[Mapping[str, str]] = None,
+    reinstrument: bool = False,
 ) -> None:
     """
     Initializes OpenTelemetry observability for a FastAPI application.
@@ -176,9 +263,9 @@ def init_otel_fastapi(
     This function configures OpenTelemetry instrumentation for the provided FastAPI
     instance. It initializes the service observability with the given service name,
     optional service namespace, deployment environment, and additional attributes.
-    If the FastAPIInstrumentor is available, the function ensures that the app is
-    instrumented by uninstrumenting any existing instrumentation first and then
-    reapplying it.
+    If the FastAPIInstrumentor is available, the app is instrumented once; repeated
+    calls for the same app are skipped unless `reinstrument` is set, in which case
+    the existing instrumentation is removed first and then reapplied.
 
     Args:
         app: The FastAPI application instance to be instrumented.
@@ -189,6 +276,8 @@ def init_otel_fastapi(
             (e.g., production, staging). Defaults to None.
         extra: A mapping of additional attributes to supplement observability
             data. Defaults to None.
+        reinstrument: Whether to uninstrument and instrument the app again even if
+            it was already instrumented by this function. Defaults to False.
     """
     init_observability(
         service_name=service_name,
@@ -197,14 +286,26 @@ def init_otel_fastapi(
         extra=extra,
     )
 
-    if FastAPIInstrumentor is not None:
+    instrumentor = _fastapi_instrumentor()
+    if instrumentor is None:
+        return
+    if app in _INSTRUMENTED_APPS and not reinstrument:
+        return
+
+    if reinstrument:
+        uninstrument_app = getattr(instrumentor, 'uninstrument_app', None)
+        if uninstrument_app is not None:
+            try:
+                uninstrument_app(app)
+            except Exception:
+                pass
+    instrument_app = getattr(instrumentor, 'instrument_app', None)
+    if instrument_app is not None:
+        instrument_app(app)
         try:
-            if hasattr(FastAPIInstrumentor, 'uninstrument_app'):
-                FastAPIInstrumentor.uninstrument_app(app)  # type: ignore[attr-defined]
-        except Exception:
+            _INSTRUMENTED_APPS.add(app)
+        except TypeError:  # not weak-referenceable, so it cannot be tracked
             pass
-        if hasattr(FastAPIInstrumentor, 'instrument_app'):
-            FastAPIInstrumentor.instrument_app(app)  # type: ignore[attr-defined]
 
 
 def init_otel_worker(
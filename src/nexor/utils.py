@@ -1,14 +1,24 @@
+import functools
 import hashlib
 import json
 import os
 import pathlib
 import tomllib
+import types
 import warnings
-from typing import Any, ClassVar, Sequence
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar, Union, get_args, get_origin
 
 from pydantic import BaseModel, SecretStr
 from pydantic_settings import BaseSettings
 
+# Reused for every fingerprint; json.dumps() with non-default options builds a fresh encoder per call.
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
+
+def _normalize_origin(origin: str) -> str:
+    return origin.strip().rstrip('/')
+
 
 def parse_cors_origins(value: str | list[str] | None) -> tuple[str, ...]:
     """
@@ -34,15 +44,15 @@ def parse_cors_origins(value: str | list[str] | None) -> tuple[str, ...]:
     if isinstance(value, str):
         try:
             parsed = json.loads(value)
-            if isinstance(parsed, str):
-                return (parsed.strip().rstrip('/'),)
-            if isinstance(parsed, (list, tuple)):
-                return tuple(o.strip().rstrip('/') for o in parsed)
         except json.JSONDecodeError:
-            return tuple(o.strip().rstrip('/') for o in value.split(',') if o.strip())
-    if isinstance(value, (list, tuple)):
-        return tuple(str(o).strip().rstrip('/') for o in value)
-    return (str(value).strip().rstrip('/'),)
+            return tuple(_normalize_origin(o) for o in value.split(',') if o.strip())
+        if isinstance(parsed, str):
+            return (_normalize_origin(parsed),)
+        if isinstance(parsed, (list, tuple)):
+            return tuple(_normalize_origin(o) for o in parsed)
+    elif isinstance(value, (list, tuple)):
+        return tuple(_normalize_origin(str(o)) for o in value)
+    return (_normalize_origin(str(value)),)
 
 
 def _check_missing_keys(
@@ -51,28 +61,25 @@ def _check_missing_keys(
     sub_key: str = '',
     raise_on_missing: bool = True,
 ) -> list[str]:
-    env = os.getenv('ENV', '').lower()
-    testing_mode = env.startswith('test')
     missing: list[str] = []
 
-    for key in getattr(s, 'required_keys', []):
+    prefix = f'{sub_key.upper()}__' if sub_key else ''
+    for key, key_upper in getattr(s, '_required_keys_upper', ()):
         value = getattr(s, key, None)
         if isinstance(value, SecretStr):
             value = value.get_secret_value()
         if not value or not str(value).strip():
-            if sub_key:
-                name = f'{sub_key.upper()}__{key.upper()}'
-            else:
-                name = f'{key.upper()}'
-            missing.append(name)
+            missing.append(f'{prefix}{key_upper}')
 
-    for field_key, field_value in s.__dict__.items():
+    for field_key in getattr(s, '_nested_validated_fields', ()):
+        field_value = getattr(s, field_key, None)
         if isinstance(field_value, (ValidatedSettings, ValidatedModel)):
             missing += _check_missing_keys(field_value, sub_key=field_key)
 
     if missing and raise_on_missing and not sub_key:
         message = f'Missing required environment keys: {", ".join(missing)}'
-        if testing_mode:
+        # Only consulted on failure, so nested levels and the common all-present case never touch os.environ.
+        if os.getenv('ENV', '').lower().startswith('test'):
             warnings.warn(message)
         else:
             raise RuntimeError(message)
@@ -80,6 +87,42 @@ def _check_missing_keys(
     return missing
 
 
+def _nested_requirement(annotation: Any) -> bool | None:
+    """Return None if the annotation cannot hold a validated model, else whether that model may require keys."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        results = [result for result in map(_nested_requirement, get_args(annotation)) if result is not None]
+        return any(results) if results else None
+    if isinstance(annotation, type):
+        if issubclass(annotation, (ValidatedSettings, ValidatedModel)):
+            return annotation._has_required_transitive
+        return None
+    # Generic containers are not scanned by _check_missing_keys; Any and unresolved forward refs might hold a model.
+    return True if origin is None else None
+
+
+def _requires_check(s: 'ValidatedSettings | ValidatedModel') -> bool:
+    """Whether the instance or any nested validated value may require keys.
+
+    The class flag only reflects annotations; a field annotated with a key-less base can still hold a
+    subclass instance with required keys, so nested values are inspected at runtime.
+    """
+    if s._has_required_transitive:
+        return True
+    for field_key in s._nested_validated_fields:
+        field_value = getattr(s, field_key, None)
+        if isinstance(field_value, (ValidatedSettings, ValidatedModel)) and _requires_check(field_value):
+            return True
+    return False
+
+
+def _init_validated_class(cls: 'type[ValidatedSettings | ValidatedModel]') -> None:
+    nested = {name: _nested_requirement(field.annotation) for name, field in cls.model_fields.items()}
+    cls._nested_validated_fields = tuple(name for name, requirement in nested.items() if requirement is not None)
+    cls._has_required_transitive = bool(cls.required_keys) or any(nested.values())
+    cls._required_keys_upper = tuple((key, key.upper()) for key in cls.required_keys)
+
+
 class ValidatedSettings(BaseSettings):
     """
     ValidatedSettings is a subclass of BaseSettings designed to ensure critical configuration
@@ -88,6 +131,7 @@ class ValidatedSettings(BaseSettings):
     This class provides a mechanism to validate the presence of required configuration keys,
     helping to prevent runtime errors due to missing settings. After the instance is created,
     it automatically checks for missing keys based on the defined `required_keys` class variable.
+    Classes without required keys on themselves or any nested validated field skip the check.
 
     Attributes:
         required_keys (ClassVar[list[str]]): A class-level attribute that lists the keys
@@ -95,9 +139,18 @@ class ValidatedSettings(BaseSettings):
     """
 
     required_keys: ClassVar[list[str]] = []
+    _has_required_transitive: ClassVar[bool] = False
+    _nested_validated_fields: ClassVar[tuple[str, ...]] = ()
+    _required_keys_upper: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _init_validated_class(cls)
 
     def model_post_init(self, context: Any, /) -> None:
-        _check_missing_keys(self)
+        if _requires_check(self):
+            _check_missing_keys(self)
 
 
 class ValidatedModel(BaseModel):
@@ -114,9 +167,18 @@ class ValidatedModel(BaseModel):
     """
 
     required_keys: ClassVar[list[str]] = []
+    _has_required_transitive: ClassVar[bool] = False
+    _nested_validated_fields: ClassVar[tuple[str, ...]] = ()
+    _required_keys_upper: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _init_validated_class(cls)
 
     def model_post_init(self, context: Any, /) -> None:
-        _check_missing_keys(self, raise_on_missing=False)
+        if _requires_check(self):
+            _check_missing_keys(self, raise_on_missing=False)
 
 
 class FingerprintMixin(BaseModel):
@@ -125,22 +187,33 @@ class FingerprintMixin(BaseModel):
 
     This class provides functionality to calculate a cryptographic fingerprint
     based on the specified fields of the model. It verifies that included and
-    excluded fields are valid and do not have conflicts. The resulting fingerprint
-    ensures uniqueness based on the specified attributes.
+    excluded fields are valid and do not have conflicts; this check runs once when
+    a subclass is defined, so misconfigured models fail at import time. The resulting
+    fingerprint ensures uniqueness based on the specified attributes.
 
     Attributes:
         fingerprint_keys (ClassVar[Sequence[str] | None]): Specifies the fields to be
             included in the fingerprint calculation. If None, all fields are considered.
         fingerprint_exclude (ClassVar[Sequence[str] | None]): Specifies the fields to
             be excluded from the fingerprint calculation.
+        fingerprint_algorithm (ClassVar[str]): The hashlib algorithm used for the digest.
+            Defaults to 'sha256'; models whose fingerprints are never persisted or used for
+            security can opt into a faster hash such as 'blake2b'.
     """
 
     fingerprint_keys: ClassVar[Sequence[str] | None] = None
     fingerprint_exclude: ClassVar[Sequence[str] | None] = None
+    fingerprint_algorithm: ClassVar[str] = 'sha256'
 
-    def get_fingerprint(self) -> str:
-        include_set = set(self.fingerprint_keys) if self.fingerprint_keys is not None else None
-        exclude_set = set(self.fingerprint_exclude) if self.fingerprint_exclude is not None else None
+    _fingerprint_include_set: ClassVar[frozenset[str] | None] = None
+    _fingerprint_exclude_set: ClassVar[frozenset[str] | None] = None
+    _fingerprint_hasher: ClassVar[Callable[[bytes], Any]] = hashlib.sha256
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        include_set = frozenset(cls.fingerprint_keys) if cls.fingerprint_keys is not None else None
+        exclude_set = frozenset(cls.fingerprint_exclude) if cls.fingerprint_exclude is not None else None
 
         if include_set and exclude_set:
             overlap = include_set & exclude_set
@@ -148,7 +221,7 @@ class FingerprintMixin(BaseModel):
                 joined = ', '.join(sorted(overlap))
                 raise ValueError(f'Fingerprint keys appear in both include and exclude: {joined}')
 
-        model_fields = set(type(self).model_fields)
+        model_fields = set(cls.model_fields)
         if include_set is not None:
             invalid_includes = include_set - model_fields
             if invalid_includes:
@@ -161,11 +234,29 @@ class FingerprintMixin(BaseModel):
                 joined = ', '.join(sorted(invalid_excludes))
                 raise ValueError(f'Fingerprint exclude references unknown fields: {joined}')
 
-        payload = self.model_dump(include=include_set, exclude=exclude_set, mode='json')
-        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        algorithm = cls.fingerprint_algorithm
+        if algorithm not in hashlib.algorithms_available or algorithm.startswith('shake_'):
+            raise ValueError(f'Unsupported fingerprint algorithm: {algorithm}')
+
+        cls._fingerprint_include_set = include_set
+        cls._fingerprint_exclude_set = exclude_set
+        cls._fingerprint_hasher = getattr(hashlib, algorithm, None) or functools.partial(hashlib.new, algorithm)
+
+    def get_fingerprint(self) -> str:
+        payload = self.model_dump(
+            include=self._fingerprint_include_set,
+            exclude=self._fingerprint_exclude_set,
+            mode='json',
+        )
+        canonical = _CANONICAL_JSON_ENCODER.encode(payload)
+        return self._fingerprint_hasher(canonical.encode()).hexdigest()
+
+
+_LEGACY_POSTGRES_SCHEME = 'postgres://'
+_POSTGRES_SCHEME = 'postgresql://'
 
 
+@functools.lru_cache(maxsize=64)
 def normalize_postgres_url(url: str) -> str:
     """
     Normalizes a PostgreSQL connection URL to use the 'postgresql://' schema instead
@@ -177,8 +268,8 @@ def normalize_postgres_url(url: str) -> str:
     Returns:
         str: A normalized PostgreSQL connection URL starting with 'postgresql://'.
     """
-    if url.startswith('postgres://'):
-        return url.replace('postgres://', 'postgresql://', 1)
+    if url.startswith(_LEGACY_POSTGRES_SCHEME):
+        return _POSTGRES_SCHEME + url[len(_LEGACY_POSTGRES_SCHEME) :]
     return url
 
 
@@ -188,13 +279,22 @@ APP_ROOT_ENV = 'NEXOR_APP_ROOT'
 
 def _find_pyproject_root() -> pathlib.Path | None:
     """Return the closest pyproject root, allowing overrides and falling back to this package."""
-    env_path = os.getenv(APP_ROOT_ENV)
+    try:
+        return _resolve_pyproject_root(os.getenv(APP_ROOT_ENV), pathlib.Path.cwd())
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_pyproject_root(env_path: str | None, cwd: pathlib.Path) -> pathlib.Path:
+    # Keyed on the override and the working directory, so changing either triggers a fresh walk.
+    # A miss raises instead of returning None: lru_cache does not cache exceptions, so a pyproject.toml
+    # created later is still found.
     if env_path:
         path = pathlib.Path(env_path).expanduser()
         if (path / PYPROJECT_FILE).is_file():
             return path
 
-    cwd = pathlib.Path.cwd()
     for candidate in (cwd, *cwd.parents):
         if (candidate / PYPROJECT_FILE).is_file():
             return candidate
@@ -203,7 +303,7 @@ def _find_pyproject_root() -> pathlib.Path | None:
     if (fallback / PYPROJECT_FILE).is_file():
         return fallback
 
-    return None
+    raise FileNotFoundError(PYPROJECT_FILE)
 
 
 def _load_project_metadata(attribute: str) -> str:
@@ -219,12 +319,14 @@ def _load_project_metadata(attribute: str) -> str:
         return 'unknown'
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_version() -> str:
     """
     Retrieves the current application version.
 
     This function fetches the version information of the application
-    from the project's metadata.
+    from the project's metadata. The value is read once per process;
+    call `get_app_version.cache_clear()` to pick up a changed project root.
 
     Returns:
         str: The current version of the application.
@@ -232,12 +334,14 @@ def get_app_version() -> str:
     return _load_project_metadata('version')
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_name() -> str:
     """
     Retrieves the application name from the project's metadata.
 
     The function utilizes the project's metadata to fetch
-    the name of the application.
+    the name of the application. The value is read once per process;
+    call `get_app_name.cache_clear()` to pick up a changed project root.
 
     Returns:
         str: The name of the application.
@@ -1,16 +1,26 @@
+import asyncpg
 import pytest
+import pytest_asyncio
 from pydantic import SecretStr
 from testcontainers.postgres import PostgresContainer
 
-from nexor.config import NexorDBSettings
+from nexor.config import DatabaseSettings
+from nexor.infrastructure import db
 
 POSTGRES_IMAGE = 'postgres:16-alpine'
+# The data is thrown away after the run: keep PGDATA in memory and skip durability work.
+POSTGRES_COMMAND = 'postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off'
+POSTGRES_TMPFS = {'/var/lib/postgresql/data': 'rw'}
+
+
+def _new_postgres_container() -> PostgresContainer:
+    return PostgresContainer(POSTGRES_IMAGE, tmpfs=POSTGRES_TMPFS).with_command(POSTGRES_COMMAND)
 
 
 @pytest.fixture(scope='session')
 def postgres_container():
-    """Provide a PostgreSQL container for the integration tests."""
-    container = PostgresContainer(POSTGRES_IMAGE)
+    """Provide a PostgreSQL container, started once per test session, for the integration tests."""
+    container = _new_postgres_container()
     container.start()
     try:
         yield container
@@ -24,10 +34,27 @@ def postgres_url(postgres_container) -> SecretStr:
     return SecretStr(postgres_container.get_connection_url())
 
 
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
+async def pg_pool(postgres_url):
+    """Share one small asyncpg pool across the session so tests skip the connect/auth round trip."""
+    pool = await asyncpg.create_pool(dsn=db._to_asyncpg_dsn(postgres_url.get_secret_value()), min_size=2, max_size=4)
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session', autouse=True)
+async def _dispose_db_engines():
+    """Close the engines and pools cached for the shared session loop once all tests are done."""
+    yield
+    await db.dispose_engines()
+
+
 @pytest.fixture(scope='session')
-def db_settings(postgres_url) -> NexorDBSettings:
+def db_settings(postgres_url) -> DatabaseSettings:
     """Return settings configured to talk to the test Postgres instance."""
-    return NexorDBSettings(
+    return DatabaseSettings(
         postgres_url=postgres_url,
         alembic_url=postgres_url,
         app_schema='integration',
@@ -6,17 +6,16 @@ from tenauth.schemas import AccessContext
 
 from nexor.infrastructure import db
 
-pytestmark = pytest.mark.integration
+# A single session-wide event loop keeps the cached engines and asyncpg pools alive between tests.
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope='session')]
 
 
-@pytest.mark.asyncio
 async def test_session_factory_can_execute_queries(db_settings):
     async with db.session_factory(db_settings) as session:
         result = await session.execute(text('SELECT 1'))  # simple identity check
         assert result.scalar_one() == 1
 
 
-@pytest.mark.asyncio
 async def test_scoped_session_binds_tenant_context(db_settings):
     tenant_id = uuid4()
     user_id = uuid4()
@@ -30,14 +29,21 @@ async def test_scoped_session_binds_tenant_context(db_settings):
         assert user_result.scalar_one() == str(user_id)
 
 
-@pytest.mark.asyncio
-async def test_pg_connection_applies_tenant_settings(postgres_url):
+async def test_pg_connection_applies_tenant_settings(pg_pool):
     tenant_id = uuid4()
-    async with db.pg_connection(postgres_url, tenant_id) as conn:
-        current_tenant = await conn.fetchval("SELECT current_setting('app.tenant_id')")
+    async with db.pg_connection(pg_pool, tenant_id) as conn:
+        # Parameterised, so asyncpg's per-connection statement cache reuses the prepared plan.
+        current_tenant = await conn.fetchval('SELECT current_setting($1)', 'app.tenant_id')
         assert current_tenant == str(tenant_id)
 
 
-@pytest.mark.asyncio
+async def test_pg_connection_does_not_leak_tenant_between_checkouts(postgres_url):
+    async with db.pg_connection(postgres_url, uuid4()):
+        pass
+    async with db.pg_connection(postgres_url, None) as conn:
+        current_tenant = await conn.fetchval("SELECT current_setting('app.tenant_id', true)")
+        assert not current_tenant
+
+
 async def test_test_db_connection_is_successful(db_settings):
     await db.test_db_connection(db_settings)
@@ -0,0 +1,35 @@
+import asyncio
+import gc
+import weakref
+
+import pytest
+from sqlalchemy import text
+
+from nexor.infrastructure import db
+
+pytestmark = pytest.mark.integration
+
+
+def test_disposed_loop_with_connected_engine_and_pool_is_collected(db_settings, postgres_url):
+    # Connected engines and pools reference their loop, so eviction needs dispose_engines before close.
+    loop = asyncio.new_event_loop()
+
+    async def connect_then_dispose():
+        async with db.session_factory(db_settings) as session:
+            await session.execute(text('SELECT 1'))
+        async with db.pg_connection(postgres_url, None) as conn:
+            await conn.fetchval('SELECT 1')
+        await db.dispose_engines()
+        return id(asyncio.get_running_loop())
+
+    loop_id = loop.run_until_complete(connect_then_dispose())
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+    loop_ref = weakref.ref(loop)
+    del loop
+    gc.collect()
+
+    assert loop_ref() is None
+    assert loop_id not in db._tracked_loops
+    assert loop_id not in db._engine_cache
+    assert loop_id not in db._asyncpg_pool_cache
@@ -1,6 +1,10 @@
+import io
 import logging as std_logging
+import queue
 from types import SimpleNamespace
 
+import pytest
+
 import nexor.logging as nexor_logging
 
 
@@ -8,34 +12,226 @@ def test_map_loguru_level_defaults_to_info_for_unknown_names():
     assert nexor_logging._map_loguru_level('never heard of this') == std_logging.INFO
 
 
-def test_configure_loguru_logging_adds_sink_and_skips_second_call(monkeypatch):
-    remove_called = False
-    add_calls = []
+DEBUG_LOG_SETTINGS = nexor_logging.LogSettings(
+    log_level='DEBUG',
+    log_enqueue=False,
+    log_backtrace=False,
+    log_diagnose=False,
+    log_console_plain=True,
+)
+
+
+@pytest.fixture(scope='module')
+def _loguru_stub():
+    """Replace the loguru sink API once for the module; tests only inspect the recorded calls."""
+    recorded = SimpleNamespace(add_calls=[], remove_calls=0)
 
     def fake_remove():
-        nonlocal remove_called
-        remove_called = True
+        recorded.remove_calls += 1
 
     def fake_add(*args, **kwargs):
-        add_calls.append((args, kwargs))
+        recorded.add_calls.append((args, kwargs))
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(nexor_logging.logger, 'remove', fake_remove)
+        mp.setattr(nexor_logging.logger, 'add', fake_add)
+        yield recorded
+
+
+@pytest.fixture
+def loguru_calls(_loguru_stub, monkeypatch):
+    _loguru_stub.add_calls.clear()
+    _loguru_stub.remove_calls = 0
     monkeypatch.setattr(nexor_logging, '_configured_loguru', False)
-    monkeypatch.setattr(nexor_logging.logger, 'remove', fake_remove)
-    monkeypatch.setattr(nexor_logging.logger, 'add', fake_add)
-
-    settings = SimpleNamespace(
-        log_level='DEBUG',
-        log_enqueue=False,
-        log_backtrace=False,
-        log_diagnose=False,
-        log_console_plain=True,
+    return _loguru_stub
+
+
+def test_configure_loguru_logging_adds_sink_and_skips_second_call(loguru_calls):
+    nexor_logging.configure_loguru_logging(settings=DEBUG_LOG_SETTINGS)
+
+    assert loguru_calls.remove_calls
+    assert len(loguru_calls.add_calls) == 1
+    assert loguru_calls.add_calls[0][1]['level'] == 'DEBUG'
+
+    nexor_logging.configure_loguru_logging(settings=DEBUG_LOG_SETTINGS)
+    assert len(loguru_calls.add_calls) == 1
+
+
+@pytest.mark.parametrize(('otlp_configured', 'expected_sinks'), [(True, 0), (False, 1)])
+def test_configure_loguru_logging_leaves_console_to_stdlib_when_requested(
+    monkeypatch, loguru_calls, otlp_configured, expected_sinks
+):
+    otlp_calls = []
+
+    def fake_otlp(settings, *, exporter_settings, console_via_stdlib):
+        otlp_calls.append(console_via_stdlib)
+        return otlp_configured
+
+    monkeypatch.setattr(nexor_logging, '_configure_otlp_loguru', fake_otlp)
+
+    nexor_logging.configure_loguru_logging(
+        settings=nexor_logging.LogSettings(log_console_only=False),
+        exporter_settings=nexor_logging.LogExporterSettings(enabled=True),
     )
 
-    nexor_logging.configure_loguru_logging(settings=settings)
+    assert otlp_calls == [True]
+    assert len(loguru_calls.add_calls) == expected_sinks
+
+
+def test_loguru_bridge_forwards_exception_traceback_to_console(monkeypatch, loguru_calls):
+    monkeypatch.setattr(nexor_logging, '_loguru_forward_added', False)
+    nexor_logging._bridge_loguru_to_stdlib('DEBUG')
+    [((forward,), _)] = loguru_calls.add_calls
+
+    console = io.StringIO()
+    console_handler = std_logging.StreamHandler(console)
+    console_handler.setFormatter(std_logging.Formatter(nexor_logging._STDLIB_CONSOLE_FORMAT))
+    target = std_logging.getLogger('nexor.tests.loguru_bridge')
+    monkeypatch.setattr(target, 'propagate', False)
+    monkeypatch.setattr(target, 'handlers', [console_handler])
+    try:
+        raise ValueError('boom')
+    except ValueError as exc:
+        exception = (type(exc), exc, exc.__traceback__)
+    record = {
+        'level': SimpleNamespace(name='ERROR'),
+        'name': target.name,
+        'message': 'failed',
+        'exception': exception,
+        'extra': {},
+    }
+
+    forward(SimpleNamespace(record=record))
+
+    output = console.getvalue()
+    assert 'failed' in output
+    assert 'Traceback (most recent call last)' in output
+    assert 'ValueError: boom' in output
+
+
+def test_queue_pipeline_moves_handlers_behind_listener(monkeypatch):
+    monkeypatch.setattr(nexor_logging, '_queue_listener', None)
+    monkeypatch.setattr(nexor_logging, '_queue_handler', None)
+    records = []
+
+    class CaptureHandler(std_logging.Handler):
+        def emit(self, record):
+            records.append((record.getMessage(), record.exc_info is not None))
+
+    target = std_logging.getLogger('nexor.tests.queue_pipeline')
+    monkeypatch.setattr(target, 'propagate', False)
+    target.addHandler(CaptureHandler())
+
+    nexor_logging._install_queue_pipeline(target, maxsize=10)
+    listener = nexor_logging._queue_listener
+    try:
+        assert [type(handler) for handler in target.handlers] == [nexor_logging._DroppingQueueHandler]
+        target.warning('hello %s', 'world')
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            target.exception('failed')
+    finally:
+        listener.stop()
+        target.handlers.clear()
+
+    assert records == [('hello world', False), ('failed', True)]
+
+
+def test_otel_handler_keeps_span_context_with_queue_pipeline(monkeypatch):
+    from opentelemetry.exporter.otlp.proto.http import _log_exporter
+    from opentelemetry.sdk._logs.export import InMemoryLogExporter
+    from opentelemetry.sdk.trace import TracerProvider
+
+    monkeypatch.setattr(nexor_logging, '_queue_listener', None)
+    monkeypatch.setattr(nexor_logging, '_queue_handler', None)
+    exporter = InMemoryLogExporter()
+    monkeypatch.setattr(_log_exporter, 'OTLPLogExporter', lambda: exporter)
+    target = std_logging.getLogger('nexor.tests.otel_span_context')
+    monkeypatch.setattr(target, 'propagate', False)
+    target.setLevel(std_logging.INFO)
+
+    nexor_logging._configure_otlp_stdlib(
+        exporter_settings=nexor_logging.LogExporterSettings(enabled=True, service_name='span-context'),
+        level=std_logging.INFO,
+        root_logger=target,
+        settings=SimpleNamespace(),
+    )
+    nexor_logging._install_queue_pipeline(target, maxsize=10)
+    try:
+        with TracerProvider().get_tracer(__name__).start_as_current_span('request') as span:
+            target.warning('inside span')
+        nexor_logging._stop_queue_listener()
+        for handler in nexor_logging._root_handlers(target):
+            handler.flush()
+    finally:
+        nexor_logging._stop_queue_listener()
+        target.handlers.clear()
+
+    [exported] = exporter.get_finished_logs()
+    assert exported.log_record.trace_id == span.get_span_context().trace_id
+    assert exported.log_record.span_id == span.get_span_context().span_id
+
+
+def test_queue_pipeline_restarts_listener_in_forked_child(monkeypatch):
+    monkeypatch.setattr(nexor_logging, '_queue_listener', None)
+    monkeypatch.setattr(nexor_logging, '_queue_handler', None)
+    records = []
+
+    class CaptureHandler(std_logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+
+    target = std_logging.getLogger('nexor.tests.queue_pipeline_fork')
+    monkeypatch.setattr(target, 'propagate', False)
+    target.addHandler(CaptureHandler())
+
+    nexor_logging._install_queue_pipeline(target, maxsize=10)
+    parent_listener = nexor_logging._queue_listener
+    parent_listener.stop()
+    # Simulate the post-fork state: the listener object survives but its thread does not.
+    parent_listener._thread = object()
+    try:
+        nexor_logging._restart_queue_pipeline_in_child()
+        child_listener = nexor_logging._queue_listener
+        assert child_listener is not parent_listener
+        assert nexor_logging._queue_handler.queue is child_listener.queue
+        target.warning('from child')
+    finally:
+        nexor_logging._stop_queue_listener()
+        target.handlers.clear()
+
+    assert records == ['from child']
+
+
+def test_queue_listener_stop_does_not_fail_on_full_queue(monkeypatch):
+    monkeypatch.setattr(nexor_logging, '_SENTINEL_PUT_TIMEOUT_SECONDS', 0.01)
+    log_queue = queue.Queue(maxsize=1)
+    log_queue.put_nowait('pending record')
+    listener = nexor_logging._BoundedQueueListener(log_queue)
+
+    listener.enqueue_sentinel()
+
+    assert log_queue.get_nowait() is listener._sentinel
+
+
+def test_queue_handler_drops_oldest_record_when_full():
+    log_queue = queue.Queue(maxsize=2)
+    handler = nexor_logging._DroppingQueueHandler(log_queue)
+    logger = std_logging.getLogger('nexor.tests.drop_oldest')
+
+    for index in range(4):
+        handler.handle(logger.makeRecord(logger.name, std_logging.INFO, __file__, 0, 'record %s', (index,), None))
+
+    assert [log_queue.get_nowait().getMessage() for _ in range(2)] == ['record 2', 'record 3']
+    assert handler.dropped == 2
 
-    assert remove_called
-    assert len(add_calls) == 1
-    assert add_calls[0][1]['level'] == 'DEBUG'
 
-    nexor_logging.configure_loguru_logging(settings=settings)
-    assert len(add_calls) == 1
+def test_batch_processor_options_follow_exporter_settings():
+    exporter_settings = nexor_logging.LogExporterSettings(max_queue_size=100, max_export_batch_size=10)
+    assert nexor_logging._batch_processor_options(exporter_settings) == {
+        'max_queue_size': 100,
+        'max_export_batch_size': 10,
+        'schedule_delay_millis': 2000,
+        'export_timeout_millis': 30000,
+    }
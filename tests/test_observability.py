@@ -1,6 +1,63 @@
+import enum
+import subprocess
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
 import nexor.observability as observability
 
 
+@pytest.fixture(autouse=True)
+def _fresh_resource_cache():
+    observability._create_resource.cache_clear()
+    yield
+    observability._create_resource.cache_clear()
+
+
+class DummyInstrumentor:
+    calls: list = []
+
+    @classmethod
+    def uninstrument_app(cls, app):
+        cls.calls.append(('un', app))
+
+    @classmethod
+    def instrument_app(cls, app):
+        cls.calls.append(('in', app))
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _stub_instrumentor():
+    # Installed once for the module; the real instrumentor must never touch these tests' apps.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(observability, 'FastAPIInstrumentor', DummyInstrumentor)
+        yield DummyInstrumentor
+
+
+# Captured before the module-wide stubs below replace it, for the test that exercises the real setup.
+_real_ensure_provider = observability._ensure_provider
+
+
+@pytest.fixture(scope='module', autouse=True)
+def stubbed_providers():
+    """Replace provider setup once for the module so no test starts real OTLP exporters."""
+    stubs = SimpleNamespace(calls=[])
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(observability, '_ensure_provider', lambda resource: stubs.calls.append(('provider', resource)))
+        mp.setattr(
+            observability, '_ensure_metrics_provider', lambda resource: stubs.calls.append(('metrics', resource))
+        )
+        yield stubs
+
+
+@pytest.fixture(autouse=True)
+def _reset_stub_calls(stubbed_providers):
+    DummyInstrumentor.calls.clear()
+    stubbed_providers.calls.clear()
+
+
 def test_parse_otlp_headers_discards_invalid_pairs():
     raw_headers = 'alpha=1, invalid, beta = 2, gamma=three=four'
     parsed = observability.parse_otlp_headers(raw_headers)
@@ -11,6 +68,15 @@ def test_parse_otlp_headers_discards_invalid_pairs():
     }
 
 
+@pytest.mark.parametrize('raw_headers', [None, '', ',,', ' , '])
+def test_parse_otlp_headers_returns_empty_dict_for_blank_input(raw_headers):
+    assert observability.parse_otlp_headers(raw_headers) == {}
+
+
+def test_parse_otlp_headers_skips_empty_keys():
+    assert observability.parse_otlp_headers(' =orphan, ,token= abc ') == {'token': 'abc'}
+
+
 def test_build_resource_respects_environment_and_extra(monkeypatch):
     monkeypatch.setenv('SERVICE_NAMESPACE', 'team-namespace')
     monkeypatch.setenv('DEPLOYMENT_ENV', 'staging')
@@ -29,17 +95,38 @@ def test_build_resource_respects_environment_and_extra(monkeypatch):
     assert attrs['team'] == 'payments'
 
 
-def test_init_observability_initialises_providers(monkeypatch):
-    calls = []
+def test_build_resource_reuses_instance_for_identical_inputs(monkeypatch):
+    monkeypatch.setenv('SERVICE_INSTANCE_ID', 'instance-123')
+
+    first = observability.build_resource(service_name='cached', extra={'team': 'payments'})
+    second = observability.build_resource(service_name='cached', extra={'team': 'payments'})
+    monkeypatch.setenv('SERVICE_INSTANCE_ID', 'instance-456')
+    third = observability.build_resource(service_name='cached', extra={'team': 'payments'})
+
+    assert first is second
+    assert third is not first
+    assert third.attributes['service.instance.id'] == 'instance-456'
+
+
+def test_build_resource_accepts_unhashable_extra_values():
+    resource = observability.build_resource(service_name='lists', extra={'regions': ['eu', 'us']})
+
+    assert resource.attributes['regions'] == ('eu', 'us')
+    assert observability._create_resource.cache_info().currsize == 0
 
-    def fake_provider(resource):
-        calls.append(('provider', resource))
 
-    def fake_metrics(resource):
-        calls.append(('metrics', resource))
+def test_build_resource_accepts_str_subclass_values():
+    class Env(enum.StrEnum):
+        PRODUCTION = 'production'
 
-    monkeypatch.setattr(observability, '_ensure_provider', fake_provider)
-    monkeypatch.setattr(observability, '_ensure_metrics_provider', fake_metrics)
+    resource = observability.build_resource(service_name=Env.PRODUCTION, deployment_environment=Env.PRODUCTION)
+
+    assert resource.attributes['service.name'] == 'production'
+    assert resource.attributes['deployment.environment'] == 'production'
+
+
+def test_init_observability_initialises_providers(stubbed_providers):
+    calls = stubbed_providers.calls
 
     observability.init_observability(
         service_name='connector',
@@ -69,21 +156,12 @@ def test_init_otel_fastapi_instruments_app(monkeypatch):
             }
         )
 
-    class DummyInstrumentor:
-        calls = []
-
-        @classmethod
-        def uninstrument_app(cls, app):
-            cls.calls.append(('un', app))
-
-        @classmethod
-        def instrument_app(cls, app):
-            cls.calls.append(('in', app))
-
     monkeypatch.setattr(observability, 'init_observability', fake_init_observability)
-    monkeypatch.setattr(observability, 'FastAPIInstrumentor', DummyInstrumentor)
 
-    dummy_app = object()
+    class DummyApp:
+        pass
+
+    dummy_app = DummyApp()
     observability.init_otel_fastapi(dummy_app, service_name='gateway')
 
     assert init_calls == [
@@ -94,4 +172,65 @@ def test_init_otel_fastapi_instruments_app(monkeypatch):
             'extra': None,
         },
     ]
-    assert DummyInstrumentor.calls == [('un', dummy_app), ('in', dummy_app)]
+    assert DummyInstrumentor.calls == [('in', dummy_app)]
+
+    observability.init_otel_fastapi(dummy_app, service_name='gateway')
+    assert DummyInstrumentor.calls == [('in', dummy_app)]
+
+    observability.init_otel_fastapi(dummy_app, service_name='gateway', reinstrument=True)
+    assert DummyInstrumentor.calls == [('in', dummy_app), ('un', dummy_app), ('in', dummy_app)]
+
+
+def test_init_otel_fastapi_instruments_untrackable_apps(monkeypatch):
+    monkeypatch.setattr(observability, 'init_observability', lambda **kwargs: None)
+    app = object()  # no __weakref__ slot, so it cannot join the instrumented-app registry
+
+    observability.init_otel_fastapi(app, service_name='gateway')
+
+    assert DummyInstrumentor.calls == [('in', app)]
+
+
+def test_importing_observability_defers_the_sdk():
+    code = (
+        'import sys, nexor.observability; '
+        "assert not [m for m in sys.modules if m.startswith(('opentelemetry.sdk.trace', 'opentelemetry.exporter'))]"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_ensure_provider_initialises_once_under_concurrency(monkeypatch):
+    import opentelemetry.sdk.trace as sdk_trace
+    import opentelemetry.sdk.trace.export as sdk_trace_export
+    from opentelemetry.exporter.otlp.proto.http import trace_exporter
+
+    created = []
+
+    class FakeProvider:
+        def __init__(self, resource):
+            created.append(self)
+
+        def add_span_processor(self, processor):
+            pass
+
+    monkeypatch.setattr(observability, '_PROVIDER_INITIALISED', False)
+    monkeypatch.setattr(observability, '_tracer_provider', None)
+    monkeypatch.setattr(sdk_trace, 'TracerProvider', FakeProvider)
+    monkeypatch.setattr(sdk_trace_export, 'BatchSpanProcessor', lambda exporter, **kwargs: None)
+    monkeypatch.setattr(trace_exporter, 'OTLPSpanExporter', lambda: None)
+    monkeypatch.setattr(observability.trace, 'set_tracer_provider', lambda provider: None)
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(_real_ensure_provider(None))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
@@ -0,0 +1,13 @@
+import tomllib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(scope='session')
+def pyproject_data() -> dict:
+    """Parse the repository's pyproject.toml once for the whole session."""
+    with open(PROJECT_ROOT / 'pyproject.toml', 'rb') as f:
+        return tomllib.load(f)